@@ -8,19 +8,485 @@ del método draw().
 """
 import pygame
 import math
+import functools
+
+# Límites y densidad del número de segmentos de una curva de Bézier cuando se
+# deduce de la longitud de su polígono de control (segmentos por píxel)
+_BEZIER_MIN_STEPS = 8
+_BEZIER_MAX_STEPS = 128
+_BEZIER_STEPS_PER_PIXEL = 0.5
+
+# --- Funciones auxiliares de rasterización ---
+def _plot_points(surface, points, mapped_color, bounds=None):
+    """
+    Escribe una lista de píxeles en la superficie bloqueándola una sola vez.
+    
+    Equivale a llamar surface.set_at por cada punto, pero accede directamente
+    al buffer de píxeles mediante pygame.PixelArray, evitando el bloqueo y la
+    conversión de color en cada llamada. Los puntos fuera de la superficie se
+    descartan, igual que hace set_at.
+    
+    Args:
+        surface: Superficie pygame donde se dibujarán los píxeles
+        points: Iterable de puntos enteros (x, y)
+        mapped_color: Color ya convertido al formato de la superficie (Shape._color_for)
+        bounds: Caja envolvente (min_x, min_y, max_x, max_y) de los puntos, si se
+            conoce. Si cabe en la superficie se omite la comprobación por píxel.
+    """
+    width, height = surface.get_size()
+    pixels = pygame.PixelArray(surface)
+    try:
+        if (bounds is not None and bounds[0] >= 0 and bounds[1] >= 0
+                and bounds[2] < width and bounds[3] < height):
+            for point in points:
+                pixels[point] = mapped_color
+        else:
+            for x, y in points:
+                if 0 <= x < width and 0 <= y < height:
+                    pixels[x, y] = mapped_color
+    finally:
+        pixels.close()
+
+def _fill_blocks(surface, blocks, mapped_color):
+    """
+    Escribe una lista de bloques de píxeles bloqueando la superficie una sola vez.
+    
+    Args:
+        surface: Superficie pygame donde se dibujarán los bloques
+        blocks: Iterable de bloques (x0, x1, y0, y1) inclusivos, como en _fill_block
+        mapped_color: Color ya convertido al formato de la superficie (Shape._color_for)
+    """
+    pixels = pygame.PixelArray(surface)
+    try:
+        for x0, x1, y0, y1 in blocks:
+            _fill_block(pixels, x0, x1, y0, y1, mapped_color)
+    finally:
+        pixels.close()
+
+def _dda_axis(start, delta, steps):
+    """
+    Devuelve las coordenadas de un eje en los steps + 1 pasos de una línea DDA.
+    
+    El paso i está en start + delta * i / steps, redondeado al entero más
+    cercano (los empates hacia arriba). Se calcula de forma exacta con enteros
+    como start + (2 * delta * i + steps) // (2 * steps), sin acumular errores
+    de redondeo a lo largo de la línea.
+    
+    Args:
+        start: Coordenada inicial (entera)
+        delta: Diferencia entre la coordenada final y la inicial (entera)
+        steps: Número de pasos de la línea (mayor que 0)
+        
+    Returns:
+        Lista de enteros
+    """
+    if delta == 0:
+        return [start] * (steps + 1)
+    two_steps = 2 * steps
+    # Los numeradores avanzan de 2 * delta en 2 * delta; los genera range() en C
+    return [start + n // two_steps
+            for n in range(steps, steps + 2 * delta * (steps + 1), 2 * delta)]
+
+def _fill_block(pixels, x0, x1, y0, y1, mapped_color):
+    """
+    Rellena el bloque de píxeles [x0, x1] x [y0, y1] (inclusive) de un PixelArray.
+    
+    Los extremos pueden venir en cualquier orden y el bloque se recorta a los
+    límites de la superficie, igual que haría set_at píxel a píxel. Tramos
+    horizontales, verticales y rectángulos se escriben con una sola asignación
+    sobre el buffer.
+    
+    Args:
+        pixels: pygame.PixelArray abierto sobre la superficie destino
+        x0, x1: Columnas extremas del bloque
+        y0, y1: Filas extremas del bloque
+        mapped_color: Color ya convertido al formato de la superficie (Shape._color_for)
+    """
+    width, height = pixels.shape
+    if x0 > x1:
+        x0, x1 = x1, x0
+    if y0 > y1:
+        y0, y1 = y1, y0
+    x0 = max(x0, 0)
+    y0 = max(y0, 0)
+    x1 = min(x1, width - 1)
+    y1 = min(y1, height - 1)
+    if x0 > x1 or y0 > y1:
+        return
+    
+    pixels[x0:x1 + 1, y0:y1 + 1] = mapped_color
+
+def _hline(surface, x0, x1, y, mapped_color):
+    """
+    Dibuja un tramo horizontal de píxeles entre x0 y x1 (inclusive) en la fila y.
+    
+    Es el caso especial de una línea de Bresenham con dy = 0: todos los píxeles
+    son contiguos en la fila, así que se escriben con una sola asignación sobre
+    el buffer en lugar de recorrerlos uno a uno. Los rellenos, que escriben
+    muchas filas seguidas, usan _fill_block sobre un PixelArray ya abierto.
+    
+    Args:
+        surface: Superficie pygame donde se dibujará el tramo
+        x0, x1: Extremos enteros del tramo (en cualquier orden)
+        y: Fila entera del tramo
+        mapped_color: Color ya convertido al formato de la superficie (Shape._color_for)
+    """
+    pixels = pygame.PixelArray(surface)
+    try:
+        _fill_block(pixels, x0, x1, y, y, mapped_color)
+    finally:
+        pixels.close()
+
+def _vline(surface, x, y0, y1, mapped_color):
+    """
+    Dibuja un tramo vertical de píxeles entre y0 y y1 (inclusive) en la columna x.
+    
+    Args:
+        surface: Superficie pygame donde se dibujará el tramo
+        x: Columna entera del tramo
+        y0, y1: Extremos enteros del tramo (en cualquier orden)
+        mapped_color: Color ya convertido al formato de la superficie (Shape._color_for)
+    """
+    pixels = pygame.PixelArray(surface)
+    try:
+        _fill_block(pixels, x, x, y0, y1, mapped_color)
+    finally:
+        pixels.close()
+
+# Caché pequeña: al arrastrar casi cada frame trae incrementos nuevos, así que
+# solo compensa para las pocas líneas que se repiten (lados de polígonos,
+# redibujados); los píxeles de cada figura ya se guardan en Shape._rasterized
+@functools.lru_cache(maxsize=32)
+def _bresenham_offsets(dx, dy):
+    """
+    Calcula con Bresenham los desplazamientos de una línea que parte de (0, 0)
+    y avanza dx columnas y dy filas (ambos no negativos).
+    
+    La secuencia de pasos solo depende de la pendiente, no de la posición ni
+    del sentido de la línea, así que se guarda en caché y se comparte entre
+    todas las líneas con los mismos incrementos.
+    
+    Args:
+        dx: Distancia horizontal absoluta
+        dy: Distancia vertical absoluta
+    
+    Returns:
+        Tupla de desplazamientos (ox, oy)
+    """
+    steep = dy > dx
+    if steep:
+        dx, dy = dy, dx
+    
+    # Forma entera del punto medio: el error se escala por 2 para que todas
+    # las actualizaciones sean sumas, sin divisiones
+    dx2 = 2 * dx
+    dy2 = 2 * dy
+    error = dy2 - dx
+    minor = 0
+    
+    offsets = []
+    append = offsets.append
+    
+    # Un bucle por orientación, para no decidir el orden de los ejes en cada paso
+    if steep:
+        for major in range(dx + 1):
+            append((minor, major))
+            if error > 0:
+                minor += 1
+                error -= dx2
+            error += dy2
+    else:
+        for major in range(dx + 1):
+            append((major, minor))
+            if error > 0:
+                minor += 1
+                error -= dx2
+            error += dy2
+    
+    return tuple(offsets)
+
+def _bresenham_line_points(x1, y1, x2, y2):
+    """
+    Calcula los píxeles de una línea con el algoritmo de Bresenham.
+    
+    Trabaja solo con aritmética de enteros y no accede a ninguna superficie,
+    de modo que el mismo núcleo sirve para cualquier destino de dibujo. Los
+    desplazamientos se toman de la caché de _bresenham_offsets y solo se
+    trasladan y reflejan según el sentido de la línea.
+    
+    Args:
+        x1, y1: Coordenadas enteras del punto inicial
+        x2, y2: Coordenadas enteras del punto final
+    
+    Returns:
+        Lista de puntos (x, y) que forman la línea
+    """
+    sx = 1 if x1 < x2 else -1
+    sy = 1 if y1 < y2 else -1
+    offsets = _bresenham_offsets(abs(x2 - x1), abs(y2 - y1))
+    return [(x1 + ox * sx, y1 + oy * sy) for ox, oy in offsets]
+
+def _bresenham_polyline_points(points, closed):
+    """
+    Calcula los píxeles de una polilínea uniendo sus vértices con Bresenham.
+    
+    Args:
+        points: Secuencia de vértices (x, y)
+        closed: Si es True, también se une el último vértice con el primero
+        
+    Returns:
+        Lista de puntos (x, y) de todos los segmentos
+    """
+    vertices = [(int(x), int(y)) for x, y in points]
+    if closed:
+        vertices.append(vertices[0])
+    
+    pixels = []
+    extend = pixels.extend
+    for (x1, y1), (x2, y2) in zip(vertices, vertices[1:]):
+        extend(_bresenham_line_points(x1, y1, x2, y2))
+    return pixels
+
+# Caché pequeña: cada entrada ocupa unas 5,7 * radio tuplas y al arrastrar un
+# círculo hacia fuera cada frame trae un radio nuevo
+@functools.lru_cache(maxsize=32)
+def _bresenham_circle_offsets(radius):
+    """
+    Calcula con Bresenham los desplazamientos del contorno de un círculo
+    centrado en (0, 0).
+    
+    Los píxeles solo dependen del radio, así que la secuencia se guarda en
+    caché y se comparte entre los círculos recientes del mismo radio, por
+    ejemplo las previsualizaciones mientras el radio no cambia.
+    
+    Args:
+        radius: Radio entero, mayor que cero
+        
+    Returns:
+        Tupla de desplazamientos (ox, oy) de los 8 octantes
+    """
+    offsets = []
+    x = 0
+    y = radius
+    d = 3 - 2 * radius
+    
+    extend = offsets.extend
+    
+    while x <= y:
+        # Puntos simétricos en los 8 octantes
+        extend(((x, y), (y, x), (y, -x), (x, -y),
+                (-x, -y), (-y, -x), (-y, x), (-x, y)))
+        
+        if d < 0:
+            d = d + 4 * x + 6
+        else:
+            d = d + 4 * (x - y) + 10
+            y -= 1
+        x += 1
+    
+    return tuple(offsets)
+
+def _bresenham_circle_points(x0, y0, radius):
+    """
+    Calcula los píxeles del contorno de un círculo con el algoritmo de Bresenham.
+    
+    Los desplazamientos se toman de la caché de _bresenham_circle_offsets y
+    solo se trasladan al centro.
+    
+    Args:
+        x0, y0: Coordenadas enteras del centro
+        radius: Radio entero, mayor que cero
+        
+    Returns:
+        Lista de puntos (x, y) de los 8 octantes del círculo
+    """
+    return [(x0 + ox, y0 + oy) for ox, oy in _bresenham_circle_offsets(radius)]
+
+def _bresenham_ellipse_points(xc, yc, rx, ry):
+    """
+    Calcula los píxeles del contorno de una elipse con el algoritmo de Bresenham
+    (punto medio), recorriendo las regiones 1 y 2 de un cuadrante.
+    
+    Args:
+        xc, yc: Coordenadas enteras del centro
+        rx, ry: Radios enteros en X e Y
+        
+    Returns:
+        Lista de puntos (x, y) de los 4 cuadrantes de la elipse
+    """
+    rx2 = rx * rx
+    ry2 = ry * ry
+    two_rx2 = 2 * rx2
+    two_ry2 = 2 * ry2
+    
+    points = []
+    append = points.append
+    
+    # Región 1 (los parámetros de decisión se escalan por 4 para que sean enteros)
+    x, y = 0, ry
+    
+    d1 = 4 * ry2 - 4 * rx2 * ry + rx2
+    dx = 0
+    dy = two_rx2 * y
+    
+    # Procesamiento en la región 1
+    while dx < dy:
+        # 4 puntos simétricos respecto al centro
+        append((xc + x, yc + y))
+        append((xc - x, yc + y))
+        append((xc + x, yc - y))
+        append((xc - x, yc - y))
+        
+        if d1 < 0:
+            x += 1
+            dx += two_ry2
+            d1 += 4 * (dx + ry2)
+        else:
+            x += 1
+            y -= 1
+            dx += two_ry2
+            dy -= two_rx2
+            d1 += 4 * (dx - dy + ry2)
+    
+    # Región 2
+    d2 = ry2 * (2 * x + 1) * (2 * x + 1) + \
+         4 * rx2 * (y - 1) * (y - 1) - \
+         4 * rx2 * ry2
+    
+    # Procesamiento en la región 2
+    while y >= 0:
+        append((xc + x, yc + y))
+        append((xc - x, yc + y))
+        append((xc + x, yc - y))
+        append((xc - x, yc - y))
+        
+        if d2 > 0:
+            y -= 1
+            dy -= two_rx2
+            d2 += 4 * (rx2 - dy)
+        else:
+            y -= 1
+            x += 1
+            dx += two_ry2
+            dy -= two_rx2
+            d2 += 4 * (dx - dy + rx2)
+    
+    return points
 
 # --- Clase Base para Figuras ---
-class Shape:
+class _ShapeMeta(type):
+    """
+    Metaclase de las figuras: marca cada figura como terminada en cuanto su
+    constructor (el de la subclase más concreta) acaba.
+    """
+    def __call__(cls, *args, **kwargs):
+        shape = super().__call__(*args, **kwargs)
+        object.__setattr__(shape, '_frozen', True)
+        return shape
+
+class Shape(metaclass=_ShapeMeta):
     """
     Clase base abstracta para todas las figuras.
     
+    Las figuras son inmutables una vez construidas: la caja envolvente, los
+    píxeles rasterizados y el color convertido se calculan a partir de sus
+    atributos públicos y se guardan, así que reasignar uno de ellos lanza
+    AttributeError. Para cambiar una figura hay que crear otra. Tampoco deben
+    modificarse en el sitio los objetos mutables que guardan (rect, points).
+    
     Attributes:
         color: Tupla RGB representando el color de la figura
         filled: Boolean indicando si la figura debe dibujarse rellena o solo el contorno
     """
+    _frozen = False
+
+    def __setattr__(self, name, value):
+        # Los atributos privados (cachés) sí pueden cambiar al dibujar
+        if self._frozen and not name.startswith('_'):
+            raise AttributeError(
+                f"{type(self).__name__}.{name} no se puede modificar: las figuras son "
+                "inmutables, crea una figura nueva")
+        super().__setattr__(name, value)
+
     def __init__(self, color, filled=False):
         self.color = color
         self.filled = filled
+        self._mapped_color = None
+        self._mapped_format = None
+        self._pixel_cache = None
+        # Caja envolvente (min_x, min_y, max_x, max_y) de los píxeles que puede
+        # escribir la figura; None si no se conoce y no se descarta nunca
+        self._bounds = None
+    
+    def _outside(self, surface):
+        """
+        Indica si la figura cae por completo fuera de la superficie.
+        
+        Solo compara la caja envolvente con los límites de la superficie, de
+        modo que las figuras que no se verían se descartan antes de rasterizar
+        o bloquear la superficie.
+        
+        Args:
+            surface: Superficie pygame donde se dibujaría la figura
+            
+        Returns:
+            True si ningún píxel de la figura puede quedar dentro de la superficie
+        """
+        bounds = self._bounds
+        if bounds is None:
+            return False
+        width, height = surface.get_size()
+        return bounds[2] < 0 or bounds[3] < 0 or bounds[0] >= width or bounds[1] >= height
+    
+    def bounding_rect(self):
+        """
+        Devuelve el rectángulo que contiene todos los píxeles de la figura.
+        
+        Returns:
+            pygame.Rect con la caja envolvente, o None si la figura no la conoce
+        """
+        if self._bounds is None:
+            return None
+        min_x, min_y, max_x, max_y = self._bounds
+        return pygame.Rect(min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
+    
+    def _rasterized(self, rasterize):
+        """
+        Devuelve los píxeles de la figura, calculándolos solo la primera vez.
+        
+        Las figuras no cambian después de crearse (ver Shape), así que el
+        resultado del algoritmo de rasterización se guarda y los redibujados posteriores
+        solo escriben los píxeles o tramos ya calculados.
+        
+        Args:
+            rasterize: Función sin argumentos que calcula la lista de puntos (x, y)
+                del contorno o de bloques (x0, x1, y0, y1) del relleno
+            
+        Returns:
+            La lista calculada por rasterize
+        """
+        if self._pixel_cache is None:
+            self._pixel_cache = rasterize()
+        return self._pixel_cache
+    
+    def _color_for(self, surface):
+        """
+        Devuelve el color de la figura convertido al formato de píxel de la superficie.
+        
+        La conversión se guarda y solo se repite si la figura se dibuja sobre
+        una superficie con otro formato de píxel.
+        
+        Args:
+            surface: Superficie pygame donde se dibujará la figura
+            
+        Returns:
+            Entero con el color en el formato nativo de la superficie
+        """
+        pixel_format = (surface.get_bitsize(), surface.get_masks())
+        if pixel_format != self._mapped_format:
+            self._mapped_color = surface.map_rgb(self.color)
+            self._mapped_format = pixel_format
+        return self._mapped_color
     
     def draw(self, surface):
         """
@@ -47,6 +513,14 @@ class Line(Shape):
         self.start_pos = start_pos
         self.end_pos = end_pos
         self.algorithm = algorithm
+        x1, y1 = int(start_pos[0]), int(start_pos[1])
+        x2, y2 = int(end_pos[0]), int(end_pos[1])
+        self._bounds = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        # El método de dibujo se elige una sola vez; por defecto, 'pygame'
+        self._draw_impl = {
+            'dda': self._draw_dda,
+            'bresenham': self._draw_bresenham,
+        }.get(algorithm, self._draw_pygame)
 
     def draw(self, surface):
         """
@@ -55,41 +529,55 @@ class Line(Shape):
         Args:
             surface: Superficie pygame donde se dibujará la línea
         """
-        if self.algorithm == 'dda':
-            self._draw_dda(surface)
-        elif self.algorithm == 'bresenham':
-            self._draw_bresenham(surface)
-        else:  # Por defecto o si se especifica 'pygame'
-            pygame.draw.line(surface, self.color, self.start_pos, self.end_pos, 1)
+        if self._outside(surface):
+            return
+        self._draw_impl(surface)
+    
+    def _draw_pygame(self, surface):
+        """
+        Dibuja la línea con la función nativa de pygame.
+        
+        Args:
+            surface: Superficie pygame donde se dibujará la línea
+        """
+        pygame.draw.line(surface, self.color, self.start_pos, self.end_pos, 1)
             
     def _draw_dda(self, surface):
         """
-        Implementa el algoritmo DDA (Digital Differential Analyzer) para dibujar líneas.
-        Es un algoritmo de rasterización de líneas que trabaja con punto flotante.
+        Dibuja la línea con los píxeles calculados por el algoritmo DDA.
         
         Args:
             surface: Superficie pygame donde se dibujará la línea
         """
+        points = self._rasterized(self._dda_points)
+        # Cada eje avanza de forma monótona, así que los extremos acotan la línea
+        (xa, ya), (xb, yb) = points[0], points[-1]
+        bounds = (min(xa, xb), min(ya, yb), max(xa, xb), max(ya, yb))
+        _plot_points(surface, points, self._color_for(surface), bounds)
+    
+    def _dda_points(self):
+        """
+        Implementa el algoritmo DDA (Digital Differential Analyzer) para dibujar líneas.
+        Avanza en pasos de un píxel sobre el eje mayor; la posición de cada
+        paso en el otro eje se calcula de forma exacta con aritmética entera.
+        
+        Returns:
+            Lista de puntos (x, y) que forman la línea
+        """
         x1, y1 = self.start_pos
         x2, y2 = self.end_pos
+        # La aritmética exacta de _dda_axis necesita extremos enteros, igual
+        # que Bresenham
+        x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
         
         dx = x2 - x1
         dy = y2 - y1
         steps = max(abs(dx), abs(dy))
         
         if steps == 0:
-            surface.set_at((int(x1), int(y1)), self.color)
-            return
+            return [(x1, y1)]
             
-        x_increment = dx / steps
-        y_increment = dy / steps
-        
-        x, y = x1, y1
-        
-        for _ in range(int(steps) + 1):
-            surface.set_at((int(round(x)), int(round(y))), self.color)
-            x += x_increment
-            y += y_increment
+        return list(zip(_dda_axis(x1, dx, steps), _dda_axis(y1, dy, steps)))
     
     def _draw_bresenham(self, surface):
         """
@@ -101,40 +589,25 @@ class Line(Shape):
         """
         x1, y1 = self.start_pos
         x2, y2 = self.end_pos
+        x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+        color = self._color_for(surface)
         
-        x1, y1 = int(x1), int(y1)
-        x2, y2 = int(x2), int(y2)
-        
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        sx = 1 if x1 < x2 else -1
-        sy = 1 if y1 < y2 else -1
-        
-        steep = dy > dx
-        if steep:
-            x1, y1 = y1, x1
-            x2, y2 = y2, x2
-            dx, dy = dy, dx
-            sx, sy = sy, sx
-        
-        error = dx // 2
-        y = y1
-        
-        points = []
-        
-        for x in range(x1, x2 + sx, sx):
-            if steep:
-                points.append((y, x))
+        # Casos especiales: las líneas horizontales y verticales son tramos
+        # contiguos, y en las diagonales puras ambos ejes avanzan en cada paso
+        if y1 == y2:
+            _hline(surface, x1, x2, y1, color)
+        elif x1 == x2:
+            _vline(surface, x1, y1, y2, color)
+        else:
+            if abs(x2 - x1) == abs(y2 - y1):
+                sx = 1 if x1 < x2 else -1
+                sy = 1 if y1 < y2 else -1
+                points = self._rasterized(
+                    lambda: [(x1 + i * sx, y1 + i * sy) for i in range(abs(x2 - x1) + 1)])
             else:
-                points.append((x, y))
-            
-            error -= dy
-            if error < 0:
-                y += sy
-                error += dx
-        
-        for point in points:
-            surface.set_at(point, self.color)
+                points = self._rasterized(lambda: _bresenham_line_points(x1, y1, x2, y2))
+            # Todos los píxeles de la línea caen dentro de la caja de sus extremos
+            _plot_points(surface, points, color, self._bounds)
                 
     @staticmethod
     def from_points(p1, p2, color, filled=False, algorithm='pygame'):
@@ -164,30 +637,40 @@ class Rectangle(Shape):
         super().__init__(color, filled)
         self.rect = pygame.Rect(rect)
         self.rect.normalize()
+        # Posición y dimensiones como enteros, para no consultar el Rect al dibujar
+        self._xywh = (self.rect.x, self.rect.y, self.rect.width, self.rect.height)
+        x, y, w, h = self._xywh
+        right, bottom = x + w - 1, y + h - 1
+        self._bounds = (min(x, right), min(y, bottom), max(x, right), max(y, bottom))
 
     def draw(self, surface):
         """
-        Dibuja el rectángulo usando líneas con el algoritmo de Bresenham.
+        Dibuja el rectángulo escribiendo sus lados (o su interior) como tramos de píxeles.
         
         Args:
             surface: Superficie pygame donde se dibujará el rectángulo
         """
-        x, y, w, h = self.rect.x, self.rect.y, self.rect.width, self.rect.height
+        if self._outside(surface):
+            return
+        x, y, w, h = self._xywh
+        right = x + w - 1
+        bottom = y + h - 1
+        color = self._color_for(surface)
         
-        if self.filled:
-            for row in range(y, y + h):
-                line = Line((x, row), (x + w - 1, row), self.color, False, 'bresenham')
-                line.draw(surface)
-        else:
-            top_line = Line((x, y), (x + w - 1, y), self.color, False, 'bresenham')
-            right_line = Line((x + w - 1, y), (x + w - 1, y + h - 1), self.color, False, 'bresenham')
-            bottom_line = Line((x, y + h - 1), (x + w - 1, y + h - 1), self.color, False, 'bresenham')
-            left_line = Line((x, y), (x, y + h - 1), self.color, False, 'bresenham')
-            
-            top_line.draw(surface)
-            right_line.draw(surface)
-            bottom_line.draw(surface)
-            left_line.draw(surface)
+        # Todos los lados son horizontales o verticales: se escriben como
+        # bloques contiguos del buffer con un único bloqueo de la superficie
+        pixels = pygame.PixelArray(surface)
+        try:
+            if self.filled:
+                if h > 0:
+                    _fill_block(pixels, x, right, y, bottom, color)
+            else:
+                _fill_block(pixels, x, right, y, y, color)                # Superior
+                _fill_block(pixels, right, right, y, bottom, color)       # Derecho
+                _fill_block(pixels, x, right, bottom, bottom, color)      # Inferior
+                _fill_block(pixels, x, x, y, bottom, color)               # Izquierdo
+        finally:
+            pixels.close()
 
     @staticmethod
     def from_points(p1, p2, color, filled=False):
@@ -207,7 +690,7 @@ class Rectangle(Shape):
         y = min(p1[1], p2[1])
         w = abs(p1[0] - p2[0])
         h = abs(p1[1] - p2[1])
-        return Rectangle(pygame.Rect(x, y, w, h), color, filled)
+        return Rectangle((x, y, w, h), color, filled)
 
 class Circle(Shape):
     """
@@ -223,6 +706,13 @@ class Circle(Shape):
         self.center = center
         self.radius = int(radius)
         self.algorithm = algorithm
+        # Centro en coordenadas enteras de píxel, para los algoritmos propios
+        self._center_xy = (int(center[0]), int(center[1]))
+        cx, cy = self._center_xy
+        r = max(self.radius, 0)
+        self._bounds = (cx - r, cy - r, cx + r, cy + r)
+        # El método de dibujo se elige una sola vez; por defecto, 'pygame'
+        self._draw_impl = self._draw_bresenham if algorithm == 'bresenham' else self._draw_pygame
 
     def draw(self, surface):
         """
@@ -231,11 +721,19 @@ class Circle(Shape):
         Args:
             surface: Superficie pygame donde se dibujará el círculo
         """
-        if self.algorithm == 'bresenham':
-            self._draw_bresenham(surface)
-        else:
-            width = 0 if self.filled else 1
-            pygame.draw.circle(surface, self.color, self.center, self.radius, width)
+        if self._outside(surface):
+            return
+        self._draw_impl(surface)
+    
+    def _draw_pygame(self, surface):
+        """
+        Dibuja el círculo con la función nativa de pygame.
+        
+        Args:
+            surface: Superficie pygame donde se dibujará el círculo
+        """
+        width = 0 if self.filled else 1
+        pygame.draw.circle(surface, self.color, self.center, self.radius, width)
     
     def _draw_bresenham(self, surface):
         """
@@ -244,48 +742,59 @@ class Circle(Shape):
         Args:
             surface: Superficie pygame donde se dibujará el círculo
         """
-        x0, y0 = int(self.center[0]), int(self.center[1])
-        radius = int(self.radius)
+        x0, y0 = self._center_xy
+        radius = self.radius
         
         if radius <= 0:
             surface.set_at((x0, y0), self.color)
             return
             
+        if self.filled:
+            _fill_blocks(surface, self._rasterized(self._filled_spans), self._color_for(surface))
+        else:
+            # Los ocho octantes se escriben juntos, bajo un único bloqueo
+            points = self._rasterized(lambda: _bresenham_circle_points(x0, y0, radius))
+            _plot_points(surface, points, self._color_for(surface), self._bounds)
+
+    def _filled_spans(self):
+        """
+        Calcula las filas del círculo relleno con el algoritmo de Bresenham.
+        
+        Returns:
+            Lista de tramos horizontales (x0, x1, y, y), uno por fila
+        """
+        x0, y0 = self._center_xy
+        radius = self.radius
         x = 0
         y = radius
         d = 3 - 2 * radius
         
-        if self.filled:
-            while x <= y:
-                Line((x0 - x, y0 + y), (x0 + x, y0 + y), self.color, False, 'bresenham').draw(surface)
-                Line((x0 - y, y0 + x), (x0 + y, y0 + x), self.color, False, 'bresenham').draw(surface)
-                Line((x0 - y, y0 - x), (x0 + y, y0 - x), self.color, False, 'bresenham').draw(surface)
-                Line((x0 - x, y0 - y), (x0 + x, y0 - y), self.color, False, 'bresenham').draw(surface)
-                
-                if d < 0:
-                    d = d + 4 * x + 6
-                else:
-                    d = d + 4 * (x - y) + 10
-                    y -= 1
-                x += 1
-        else:
-            while x <= y:
-                # Dibujar puntos en los 8 octantes
-                surface.set_at((x0 + x, y0 + y), self.color)
-                surface.set_at((x0 + y, y0 + x), self.color)
-                surface.set_at((x0 + y, y0 - x), self.color)
-                surface.set_at((x0 + x, y0 - y), self.color)
-                surface.set_at((x0 - x, y0 - y), self.color)
-                surface.set_at((x0 - y, y0 - x), self.color)
-                surface.set_at((x0 - y, y0 + x), self.color)
-                surface.set_at((x0 - x, y0 + y), self.color)
-                
-                if d < 0:
-                    d = d + 4 * x + 6
-                else:
-                    d = d + 4 * (x - y) + 10
-                    y -= 1
-                x += 1
+        # Semiancho de cada fila según su distancia |dy| al centro. Los pasos
+        # con la misma y repiten filas, así que se guarda el mayor y cada
+        # fila se emite una sola vez al final.
+        half_widths = [-1] * (radius + 1)
+        while x <= y:
+            if x > half_widths[y]:
+                half_widths[y] = x
+            if y > half_widths[x]:
+                half_widths[x] = y
+            
+            if d < 0:
+                d = d + 4 * x + 6
+            else:
+                d = d + 4 * (x - y) + 10
+                y -= 1
+            x += 1
+        
+        spans = []
+        append = spans.append
+        for dy, dx in enumerate(half_widths):
+            if dx < 0:
+                continue
+            append((x0 - dx, x0 + dx, y0 + dy, y0 + dy))
+            if dy:
+                append((x0 - dx, x0 + dx, y0 - dy, y0 - dy))
+        return spans
 
     @staticmethod
     def from_points(p1, p2, color, filled=False, algorithm='pygame'):
@@ -302,9 +811,11 @@ class Circle(Shape):
         Returns:
             Instancia de Circle configurada
         """
-        center = p1
-        radius = math.dist(p1, p2)
-        return Circle(center, radius, color, filled, algorithm)
+        dx = p2[0] - p1[0]
+        dy = p2[1] - p1[1]
+        # Raíz cuadrada entera: el radio se guarda truncado a entero de todos modos
+        radius = math.isqrt(int(dx * dx + dy * dy))
+        return Circle(p1, radius, color, filled, algorithm)
 
 class Ellipse(Shape):
     """
@@ -317,6 +828,10 @@ class Ellipse(Shape):
         super().__init__(color, filled)
         self.rect = pygame.Rect(rect)
         self.rect.normalize()
+        # Posición y dimensiones como enteros, para no consultar el Rect al dibujar
+        self._xywh = (self.rect.x, self.rect.y, self.rect.width, self.rect.height)
+        x, y, w, h = self._xywh
+        self._bounds = (x, y, x + w, y + h)
 
     def draw(self, surface):
         """
@@ -325,20 +840,23 @@ class Ellipse(Shape):
         Args:
             surface: Superficie pygame donde se dibujará la elipse
         """
-        if self.rect.width < 1 or self.rect.height < 1:
+        x, y, w, h = self._xywh
+        
+        if w < 1 or h < 1 or self._outside(surface):
             return
             
-        xc = self.rect.x + self.rect.width // 2
-        yc = self.rect.y + self.rect.height // 2
-        rx = self.rect.width // 2
-        ry = self.rect.height // 2
+        rx = w // 2
+        ry = h // 2
+        xc = x + rx
+        yc = y + ry
         
         if rx <= 0 or ry <= 0:
             surface.set_at((xc, yc), self.color)
             return
             
         if self.filled:
-            self._draw_filled(surface, xc, yc, rx, ry)
+            spans = self._rasterized(lambda: self._filled_spans(xc, yc, rx, ry))
+            _fill_blocks(surface, spans, self._color_for(surface))
         else:
             self._draw_bresenham_ellipse(surface, xc, yc, rx, ry)
     
@@ -351,83 +869,37 @@ class Ellipse(Shape):
             xc, yc: Coordenadas del centro de la elipse
             rx, ry: Radios de la elipse en X e Y
         """
-        xc, yc, rx, ry = int(xc), int(yc), int(rx), int(ry)
-        
-        # Región 1
-        x, y = 0, ry
-        
-        d1 = (ry * ry) - (rx * rx * ry) + (0.25 * rx * rx)
-        dx = 2 * ry * ry * x
-        dy = 2 * rx * rx * y
-        
-        def draw_points(x, y):
-            """Dibuja 4 puntos simétricos respecto al centro"""
-            surface.set_at((xc + x, yc + y), self.color)
-            surface.set_at((xc - x, yc + y), self.color)
-            surface.set_at((xc + x, yc - y), self.color)
-            surface.set_at((xc - x, yc - y), self.color)
-        
-        # Procesamiento en la región 1
-        while dx < dy:
-            draw_points(x, y)
-            
-            if d1 < 0:
-                x += 1
-                dx += 2 * ry * ry
-                d1 += dx + ry * ry
-            else:
-                x += 1
-                y -= 1
-                dx += 2 * ry * ry
-                dy -= 2 * rx * rx
-                d1 += dx - dy + ry * ry
-        
-        # Región 2
-        d2 = ((ry * ry) * ((x + 0.5) * (x + 0.5))) + \
-             ((rx * rx) * ((y - 1) * (y - 1))) - \
-             (rx * rx * ry * ry)
-        
-        # Procesamiento en la región 2
-        while y >= 0:
-            draw_points(x, y)
-            
-            if d2 > 0:
-                y -= 1
-                dy -= 2 * rx * rx
-                d2 += rx * rx - dy
-            else:
-                y -= 1
-                x += 1
-                dx += 2 * ry * ry
-                dy -= 2 * rx * rx
-                d2 += dx - dy + rx * rx
+        points = self._rasterized(
+            lambda: _bresenham_ellipse_points(int(xc), int(yc), int(rx), int(ry)))
+        _plot_points(surface, points, self._color_for(surface))
     
-    def _draw_filled(self, surface, xc, yc, rx, ry):
+    def _filled_spans(self, xc, yc, rx, ry):
         """
-        Dibuja una elipse rellena usando líneas horizontales.
+        Calcula las filas de una elipse rellena como tramos horizontales.
         
         Args:
-            surface: Superficie pygame donde se dibujará la elipse
             xc, yc: Coordenadas del centro de la elipse
             rx, ry: Radios de la elipse en X e Y
-        """
-        for y in range(yc - ry, yc + ry + 1):
-            if ry == 0:
-                continue
-                
-            dy = y - yc
-            dy_squared = dy * dy
-            term = (1.0 - dy_squared / (ry * ry)) * (rx * rx)
             
-            if term < 0:
-                continue
-                
-            dx = int(math.sqrt(term))
+        Returns:
+            Lista de tramos horizontales (x0, x1, y, y), uno por fila
+        """
+        rx_squared = rx * rx
+        ry_squared = ry * ry
+        sqrt = math.sqrt
+        spans = []
+        append = spans.append
+        
+        # El ancho de cada fila solo depende de |dy|: se calcula una vez para
+        # la mitad inferior y se refleja en la fila simétrica superior
+        for dy in range(ry + 1):
+            term = (1.0 - dy * dy / ry_squared) * rx_squared
+            dx = int(sqrt(term))
             
-            start_x = xc - dx
-            end_x = xc + dx
-            line = Line((start_x, y), (end_x, y), self.color, False, 'bresenham')
-            line.draw(surface)
+            append((xc - dx, xc + dx, yc + dy, yc + dy))
+            if dy:
+                append((xc - dx, xc + dx, yc - dy, yc - dy))
+        return spans
 
     @staticmethod
     def from_points(p1, p2, color, filled=False):
@@ -447,7 +919,7 @@ class Ellipse(Shape):
         y = min(p1[1], p2[1])
         w = abs(p1[0] - p2[0])
         h = abs(p1[1] - p2[1])
-        return Ellipse(pygame.Rect(x, y, w, h), color, filled)
+        return Ellipse((x, y, w, h), color, filled)
 
 class Triangle(Shape):
     """
@@ -455,12 +927,17 @@ class Triangle(Shape):
     
     Attributes:
         points: Lista de tres puntos (x, y) que definen los vértices
+        xs, ys: Tuplas con las coordenadas enteras X e Y de los vértices por separado
     """
     def __init__(self, points, color, filled=False):
         super().__init__(color, filled)
         if len(points) != 3:
             raise ValueError("Triangle requiere exactamente 3 puntos.")
         self.points = points
+        self.xs = tuple(int(p[0]) for p in points)
+        self.ys = tuple(int(p[1]) for p in points)
+        # Caja envolvente (min_x, min_y, max_x, max_y) de los vértices
+        self._bounds = (min(self.xs), min(self.ys), max(self.xs), max(self.ys))
 
     def draw(self, surface):
         """
@@ -469,32 +946,40 @@ class Triangle(Shape):
         Args:
             surface: Superficie pygame donde se dibujará el triángulo
         """
+        if self._outside(surface):
+            return
         if self.filled:
-            self._draw_filled(surface)
+            _fill_blocks(surface, self._rasterized(self._filled_spans), self._color_for(surface))
         else:
-            for i in range(3):
-                start_point = self.points[i]
-                end_point = self.points[(i + 1) % 3]
-                line = Line(start_point, end_point, self.color, False, 'bresenham')
-                line.draw(surface)
+            points = self._rasterized(
+                lambda: _bresenham_polyline_points(zip(self.xs, self.ys), True))
+            _plot_points(surface, points, self._color_for(surface), self._bounds)
     
-    def _draw_filled(self, surface):
+    def _filled_spans(self):
         """
         Implementa el algoritmo de relleno por escaneo de líneas para triángulos.
         
-        Args:
-            surface: Superficie pygame donde se dibujará el triángulo
+        Returns:
+            Lista de bloques (x0, x1, y0, y1): un tramo horizontal por fila, o un
+            único tramo vertical si los tres vértices comparten la misma x
         """
-        sorted_points = sorted(self.points, key=lambda p: p[1])
+        xs, ys = self.xs, self.ys
+        
+        # Ordenar los vértices por y con tres comparaciones e intercambios
+        top, middle, bottom = 0, 1, 2
+        if ys[top] > ys[middle]:
+            top, middle = middle, top
+        if ys[middle] > ys[bottom]:
+            middle, bottom = bottom, middle
+        if ys[top] > ys[middle]:
+            top, middle = middle, top
         
-        x1, y1 = sorted_points[0]
-        x2, y2 = sorted_points[1]
-        x3, y3 = sorted_points[2]
+        x1, y1 = xs[top], ys[top]
+        x2, y2 = xs[middle], ys[middle]
+        x3, y3 = xs[bottom], ys[bottom]
         
         if x1 == x2 == x3:
-            for y in range(int(y1), int(y3) + 1):
-                surface.set_at((int(x1), y), self.color)
-            return
+            return [(x1, x1, y1, y3)]
             
         # Calcular pendientes de los lados
         # Para evitar división por cero al calcular pendientes
@@ -502,24 +987,25 @@ class Triangle(Shape):
         slope_1_2 = (x2 - x1) / (y2 - y1) if y2 != y1 else 0
         slope_2_3 = (x3 - x2) / (y3 - y2) if y3 != y2 else 0
         
+        spans = []
+        
         # Escanear la parte superior del triángulo
         x_left = x_right = x1
         
         # Escanear desde el punto superior hasta el medio
-        for y in range(int(y1), int(y2) + 1):
+        for y in range(y1, y2 + 1):
             # Calcular intersecciones con el scanline
             if y2 != y1:
                 x_right = x1 + (y - y1) * slope_1_2
             if y3 != y1:
                 x_left = x1 + (y - y1) * slope_1_3
-                
+            
             # Asegurar que x_left <= x_right
             if x_left > x_right:
                 x_left, x_right = x_right, x_left
-                
-            # Dibujar línea horizontal entre intersecciones
-            line = Line((int(x_left), y), (int(x_right), y), self.color, False, 'bresenham')
-            line.draw(surface)
+            
+            # Tramo horizontal entre intersecciones
+            spans.append((int(x_left), int(x_right), y, y))
         
         # Escanear la parte inferior del triángulo
         # Reiniciar x_left o x_right dependiendo de qué lado cambia en el punto medio
@@ -528,22 +1014,23 @@ class Triangle(Shape):
                 x_left = x2
             else:
                 x_right = x2
-                
+            
         # Escanear desde el punto medio hasta el inferior
-        for y in range(int(y2) + 1, int(y3) + 1):
+        for y in range(y2 + 1, y3 + 1):
             # Calcular intersecciones con el scanline
             if y3 != y1:
                 x_left = x1 + (y - y1) * slope_1_3
             if y3 != y2:
                 x_right = x2 + (y - y2) * slope_2_3
-                
+            
             # Asegurar que x_left <= x_right
             if x_left > x_right:
                 x_left, x_right = x_right, x_left
-                
-            # Dibujar línea horizontal entre intersecciones
-            line = Line((int(x_left), y), (int(x_right), y), self.color, False, 'bresenham')
-            line.draw(surface)
+            
+            # Tramo horizontal entre intersecciones
+            spans.append((int(x_left), int(x_right), y, y))
+        
+        return spans
 
 class Polygon(Shape):
     """
@@ -551,12 +1038,17 @@ class Polygon(Shape):
     
     Attributes:
         points: Lista de puntos (x, y) que definen los vértices
+        xs, ys: Tuplas con las coordenadas enteras X e Y de los vértices por separado
     """
     def __init__(self, points, color, filled=False):
         super().__init__(color, filled)
         if len(points) < 3:
             raise ValueError("Polygon requiere al menos 3 puntos.")
         self.points = points
+        self.xs = tuple(int(p[0]) for p in points)
+        self.ys = tuple(int(p[1]) for p in points)
+        # Caja envolvente (min_x, min_y, max_x, max_y) de los vértices
+        self._bounds = (min(self.xs), min(self.ys), max(self.xs), max(self.ys))
 
     def draw(self, surface):
         """
@@ -565,49 +1057,51 @@ class Polygon(Shape):
         Args:
             surface: Superficie pygame donde se dibujará el polígono
         """
+        if self._outside(surface):
+            return
         if self.filled:
-            self._draw_filled(surface)
+            _fill_blocks(surface, self._rasterized(self._filled_spans), self._color_for(surface))
         else:
-            num_points = len(self.points)
-            for i in range(num_points):
-                start_point = self.points[i]
-                end_point = self.points[(i + 1) % num_points]
-                line = Line(start_point, end_point, self.color, False, 'bresenham')
-                line.draw(surface)
+            points = self._rasterized(
+                lambda: _bresenham_polyline_points(zip(self.xs, self.ys), True))
+            _plot_points(surface, points, self._color_for(surface), self._bounds)
     
-    def _draw_filled(self, surface):
+    def _filled_spans(self):
         """
         Implementa el algoritmo de relleno por escaneo de líneas para polígonos.
         
-        Args:
-            surface: Superficie pygame donde se dibujará el polígono
+        Returns:
+            Lista de tramos horizontales (x0, x1, y, y) entre pares de intersecciones
         """
-        min_y = min(p[1] for p in self.points)
-        max_y = max(p[1] for p in self.points)
+        xs, ys = self.xs, self.ys
+        _, min_y, _, max_y = self._bounds
+        
+        # Tabla de intersecciones por fila: cada arista se recorre una sola vez
+        # y deposita su intersección en las filas que cruza
+        rows = [[] for _ in range(max_y - min_y + 1)]
         
-        for y in range(int(min_y), int(max_y) + 1):
-            intersections = []
-            num_points = len(self.points)
+        # Vértice final de cada arista: el siguiente, cerrando con el primero
+        xs_next = xs[1:] + xs[:1]
+        ys_next = ys[1:] + ys[:1]
+        
+        for x1, y1, x2, y2 in zip(xs, ys, xs_next, ys_next):
+            if y1 == y2:
+                continue  # Las aristas horizontales no cruzan ninguna fila
             
-            for i in range(num_points):
-                p1 = self.points[i]
-                p2 = self.points[(i + 1) % num_points]
-                
-                if (p1[1] <= y < p2[1]) or (p2[1] <= y < p1[1]):
-                    if p1[1] == p2[1]:
-                        continue
-                    
-                    x = p1[0] + (y - p1[1]) * (p2[0] - p1[0]) / (p2[1] - p1[1])
-                    intersections.append(int(x))
+            # Filas y que cumplen min(y1, y2) <= y < max(y1, y2)
+            y_low, y_high = (y1, y2) if y1 < y2 else (y2, y1)
             
+            for y in range(y_low, y_high):
+                x = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+                rows[y - min_y].append(int(x))
+        
+        spans = []
+        for y, intersections in enumerate(rows, min_y):
             intersections.sort()
             
-            for i in range(0, len(intersections), 2):
-                if i + 1 < len(intersections):
-                    start_x = intersections[i]
-                    end_x = intersections[i + 1]
-                    line = Line((start_x, y), (end_x, y), self.color, False, 'bresenham')
-                    line.draw(surface)
+            for i in range(0, len(intersections) - 1, 2):
+                spans.append((intersections[i], intersections[i + 1], y, y))
+        return spans
 
 class BezierCurve(Shape):
     """
@@ -615,36 +1109,83 @@ class BezierCurve(Shape):
     
     Attributes:
         control_points: Lista de 4 puntos de control (x, y)
-        steps: Número de segmentos para aproximar la curva
+        control_xs, control_ys: Tuplas con las coordenadas X e Y de los puntos de control
+        steps: Número de segmentos para aproximar la curva; si no se indica, se
+            deduce de la longitud del polígono de control
         points: Lista de puntos calculados que componen la curva
     """
-    def __init__(self, control_points, color, filled=False, steps=20):
+    def __init__(self, control_points, color, filled=False, steps=None):
         super().__init__(color, filled)
         if len(control_points) != 4:
             raise ValueError("BezierCurve requiere exactamente 4 puntos de control.")
         self.control_points = control_points
+        self.control_xs = tuple(p[0] for p in control_points)
+        self.control_ys = tuple(p[1] for p in control_points)
+        if steps is None:
+            steps = self._adaptive_steps()
         self.steps = steps
         self._calculate_points()
+        # Los segmentos de Bresenham no salen de la caja de los puntos que unen
+        xs = [p[0] for p in self.points]
+        ys = [p[1] for p in self.points]
+        self._bounds = (min(xs), min(ys), max(xs), max(ys))
+
+    def _adaptive_steps(self):
+        """
+        Elige el número de segmentos según la longitud del polígono de control.
+        
+        La curva nunca es más larga que su polígono de control, así que esa
+        longitud acota los píxeles a cubrir: las curvas cortas se muestrean con
+        pocos puntos y las largas con más, dentro de unos límites fijos.
+        
+        Returns:
+            Número entero de segmentos
+        """
+        xs, ys = self.control_xs, self.control_ys
+        length = sum(math.hypot(xs[i + 1] - xs[i], ys[i + 1] - ys[i]) for i in range(3))
+        steps = int(length * _BEZIER_STEPS_PER_PIXEL)
+        return max(_BEZIER_MIN_STEPS, min(_BEZIER_MAX_STEPS, steps))
 
     def _calculate_points(self):
         """
         Calcula los puntos de la línea que aproximan la curva usando
         la ecuación paramétrica de la curva de Bézier cúbica.
+        
+        La curva se pasa una sola vez a la base de potencias,
+        P(t) = A*t^3 + B*t^2 + C*t + D, y como se muestrea con un paso de t
+        uniforme se recorre por diferencias finitas hacia adelante: cada punto
+        nuevo se obtiene con tres sumas por coordenada, sin productos. Las
+        diferencias se escalan por steps^3 para que con puntos de control
+        enteros sean exactas y no acumulen error de redondeo.
         """
         self.points = []
-        cp = self.control_points
-        for i in range(self.steps + 1):
-            t = i / self.steps
-            inv_t = 1 - t
-            x = ( inv_t**3 * cp[0][0] +
-                  3 * inv_t**2 * t * cp[1][0] +
-                  3 * inv_t * t**2 * cp[2][0] +
-                  t**3 * cp[3][0] )
-            y = ( inv_t**3 * cp[0][1] +
-                  3 * inv_t**2 * t * cp[1][1] +
-                  3 * inv_t * t**2 * cp[2][1] +
-                  t**3 * cp[3][1] )
-            self.points.append((int(x), int(y)))
+        x0, x1, x2, x3 = self.control_xs
+        y0, y1, y2, y3 = self.control_ys
+        ax, ay = -x0 + 3 * x1 - 3 * x2 + x3, -y0 + 3 * y1 - 3 * y2 + y3
+        bx, by = 3 * x0 - 6 * x1 + 3 * x2, 3 * y0 - 6 * y1 + 3 * y2
+        cx, cy = 3 * (x1 - x0), 3 * (y1 - y0)
+        
+        # Con t = i / steps, steps^3 * P(t) = A*i^3 + B*steps*i^2 + C*steps^2*i + D*steps^3;
+        # se parte de i = 0 con sus diferencias de primer, segundo y tercer orden.
+        # Cada punto se guarda como complejo (x + yj) para avanzar ambos ejes con
+        # una sola suma; los valores son enteros pequeños y se representan exactos
+        steps = self.steps
+        steps2 = steps * steps
+        scale = steps2 * steps
+        a = complex(ax, ay)
+        b = complex(bx, by) * steps
+        c = complex(cx, cy) * steps2
+        p = complex(x0, y0) * scale
+        dp = a + b + c
+        d2p = 6 * a + 2 * b
+        d3p = 6 * a
+        
+        append = self.points.append
+        for _ in range(steps + 1):
+            append((int(p.real / scale), int(p.imag / scale)))
+            p += dp
+            dp += d2p
+            d2p += d3p
 
     def draw(self, surface):
         """
@@ -653,9 +1194,8 @@ class BezierCurve(Shape):
         Args:
             surface: Superficie pygame donde se dibujará la curva
         """
-        if len(self.points) < 2:
+        if len(self.points) < 2 or self._outside(surface):
             return
-            
-        for i in range(len(self.points) - 1):
-            line = Line(self.points[i], self.points[i+1], self.color, False, 'bresenham')
-            line.draw(surface)
+        
+        points = self._rasterized(lambda: _bresenham_polyline_points(self.points, False))
+        _plot_points(surface, points, self._color_for(surface), self._bounds)
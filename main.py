@@ -4,6 +4,7 @@ Graficador Interactivo con Pygame
 Aplicación que permite dibujar figuras geométricas usando diferentes algoritmos de gráficos.
 Implementa una interfaz gráfica con herramientas de dibujo y opciones de configuración.
 """
+import os
 import pygame
 import sys
 import ui
@@ -19,6 +20,11 @@ LEFT_PANEL_WIDTH = 60
 RIGHT_PANEL_WIDTH = 60
 ALGORITHM_PANEL_HEIGHT = 120
 CANVAS_WIDTH = SCREEN_WIDTH - LEFT_PANEL_WIDTH - RIGHT_PANEL_WIDTH
+FPS = 60  # Frames por segundo máximos mientras se arrastra una figura
+# Sincronización vertical con ventana SCALED, solo si se pide con
+# MINILIENZO_VSYNC=1; por defecto la ventana conserva su tamaño y el ritmo lo
+# marca solo clock.tick(FPS)
+VSYNC = 1 if os.environ.get('MINILIENZO_VSYNC') == '1' else 0
 
 # Definición de colores
 WHITE = (255, 255, 255)
@@ -30,29 +36,145 @@ GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 YELLOW = (255, 255, 0)
 ORANGE = (255, 165, 0)
+PREVIEW_KEY = (255, 0, 255)  # Color transparente de la previsualización (no está en la paleta)
 
 # Configuración de la ventana principal
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+# SCALED deja que SDL presente la ventana a través de su renderer (acelerado
+# si hay GPU), que es además lo que permite pedir VSync. Con SCALED, pygame
+# amplía la ventana por un factor entero si el escritorio tiene sitio (800x600
+# se abre a 1600x1200 en una pantalla de 1440p)
+DISPLAY_FLAGS = pygame.DOUBLEBUF | (pygame.SCALED if VSYNC else 0)
+try:
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), DISPLAY_FLAGS, vsync=VSYNC)
+except pygame.error:
+    # Algunos controladores no admiten VSync: se sigue sin ella
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), DISPLAY_FLAGS)
 pygame.display.set_caption("Graficador Interactivo")
 
+# Solo se encolan los eventos que la aplicación atiende, más los de ventana
+# reexpuesta, que obligan a presentarla de nuevo. El movimiento del ratón se
+# lee con pygame.mouse.get_pos() en cada frame.
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                          pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED])
+
+# Fuentes de la previsualización, creadas una sola vez
+point_font = pygame.font.SysFont(None, 20)
+count_font = pygame.font.SysFont(None, 18)
+
 def create_canvas_surfaces(show_algorithm_panel):
     """
     Crea o recrea las superficies del canvas y previsualización.
     
+    La previsualización del arrastre solo contiene figuras opacas, así que es
+    una superficie sin canal alfa cuyo fondo es el color clave PREVIEW_KEY. Las
+    ayudas de las figuras multipunto (marcadores semitransparentes, números y
+    guías) se dibujan en guide_overlay, una capa con alfa del tamaño del canvas
+    que se mantiene transparente entre usos, y se mezclan desde ella con
+    canvas_view, la zona del canvas en la pantalla.
+    
     Args:
         show_algorithm_panel: Boolean que indica si se muestra el panel de algoritmos
         
     Returns:
-        Tupla con (canvas_surface, preview_surface, canvas_height)
+        Tupla con (canvas_surface, preview_surface, guide_overlay, canvas_view,
+        canvas_rect), donde canvas_rect es la zona de la pantalla que ocupa el canvas
     """
-    canvas_height = SCREEN_HEIGHT - (ALGORITHM_PANEL_HEIGHT if show_algorithm_panel else 0)
+    panel_height_offset = ALGORITHM_PANEL_HEIGHT if show_algorithm_panel else 0
+    canvas_height = SCREEN_HEIGHT - panel_height_offset
     
-    canvas_surf = pygame.Surface((CANVAS_WIDTH, canvas_height))
+    # Con el mismo formato de píxel que la pantalla, los blits no convierten
+    canvas_surf = pygame.Surface((CANVAS_WIDTH, canvas_height)).convert()
     canvas_surf.fill(WHITE)
     
-    preview_surf = pygame.Surface((CANVAS_WIDTH, canvas_height), pygame.SRCALPHA)
+    preview_surf = pygame.Surface((CANVAS_WIDTH, canvas_height)).convert()
+    preview_surf.fill(PREVIEW_KEY)
+    preview_surf.set_colorkey(PREVIEW_KEY)
+    
+    guide_overlay = pygame.Surface((CANVAS_WIDTH, canvas_height), pygame.SRCALPHA).convert_alpha()
+    guide_overlay.fill((0, 0, 0, 0))
     
-    return canvas_surf, preview_surf, canvas_height
+    canvas_rect = pygame.Rect(LEFT_PANEL_WIDTH, panel_height_offset, CANVAS_WIDTH, canvas_height)
+    canvas_view = screen.subsurface(canvas_rect)
+    
+    return canvas_surf, preview_surf, guide_overlay, canvas_view, canvas_rect
+
+# Marcadores ya dibujados de los puntos de referencia, uno por color
+point_markers = {}
+
+def get_point_marker(color):
+    """
+    Devuelve el marcador semitransparente de un punto de referencia.
+    
+    El círculo solo se dibuja una vez, en blanco, en point_marker_mask; cada
+    color se obtiene tiñendo una copia de esa plantilla, que se reutiliza en
+    todos los frames y para todos los puntos.
+    
+    Args:
+        color: Tupla RGB del marcador
+        
+    Returns:
+        Superficie SRCALPHA de (2 * point_radius + 1) píxeles de lado
+    """
+    marker = point_markers.get(color)
+    if marker is None:
+        marker = point_marker_mask.copy()
+        marker.fill((*color, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        point_markers[color] = marker
+    return marker
+
+def make_guide_color(color):
+    """
+    Calcula el color de las líneas guía de las curvas Bézier.
+    
+    Args:
+        color: Tupla RGB del color seleccionado
+        
+    Returns:
+        Tupla RGBA con el color aclarado y alfa 150; las guías se trazan sobre
+        una capa con alfa (guide_overlay) para que se vean semitransparentes
+    """
+    return (min(color[0] + 100, 255),
+            min(color[1] + 100, 255),
+            min(color[2] + 100, 255), 150)
+
+# Textos ya renderizados de la previsualización, por su contenido
+point_labels = {}
+count_labels = {}
+
+def get_point_label(number):
+    """
+    Devuelve el número de orden de un punto de referencia ya renderizado.
+    
+    Args:
+        number: Posición del punto, empezando en 1
+        
+    Returns:
+        Superficie con el número en blanco
+    """
+    label = point_labels.get(number)
+    if label is None:
+        label = point_font.render(str(number), True, WHITE)
+        point_labels[number] = label
+    return label
+
+def get_count_label(count, sides):
+    """
+    Devuelve el contador de puntos del polígono ya renderizado.
+    
+    Args:
+        count: Puntos colocados hasta ahora
+        sides: Número de lados del polígono
+        
+    Returns:
+        Superficie con el texto "Punto count de sides" en negro
+    """
+    key = (count, sides)
+    label = count_labels.get(key)
+    if label is None:
+        label = count_font.render(f"Punto {count} de {sides}", True, BLACK)
+        count_labels[key] = label
+    return label
 
 # Inicialización de paneles de UI
 tool_panel = ui.ToolPanel(0, 0, LEFT_PANEL_WIDTH, SCREEN_HEIGHT, LIGHT_GRAY)
@@ -61,9 +183,34 @@ algorithm_line_panel = ui.AlgorithmPanel(LEFT_PANEL_WIDTH, 0, CANVAS_WIDTH, ALGO
 algorithm_circle_panel = ui.AlgorithmCirclePanel(LEFT_PANEL_WIDTH, 0, CANVAS_WIDTH, ALGORITHM_PANEL_HEIGHT, LIGHT_GRAY)
 polygon_sides_panel = ui.PolygonSidesPanel(LEFT_PANEL_WIDTH, 0, CANVAS_WIDTH, ALGORITHM_PANEL_HEIGHT, LIGHT_GRAY)
 
+# Panel de opciones que muestra cada herramienta que lo tiene
+TOOL_PANELS = {
+    'line': algorithm_line_panel,
+    'circle': algorithm_circle_panel,
+    'polygon': polygon_sides_panel,
+}
+
+# Herramientas que se dibujan arrastrando: crean la figura desde el punto
+# inicial y el final con el color indicado y el algoritmo seleccionado
+DRAG_TOOLS = {
+    'line': lambda p1, p2, color: fig.Line.from_points(p1, p2, color, algorithm=selected_line_algorithm),
+    'rectangle': fig.Rectangle.from_points,
+    'circle': lambda p1, p2, color: fig.Circle.from_points(p1, p2, color, algorithm=selected_circle_algorithm),
+    'ellipse': fig.Ellipse.from_points,
+}
+
+# Herramientas multipunto: clase de la figura y puntos necesarios
+# (None para el polígono, que usa el número de lados seleccionado)
+MULTIPOINT_TOOLS = {
+    'triangle': (fig.Triangle, 3),
+    'curve': (fig.BezierCurve, 4),
+    'polygon': (fig.Polygon, None),
+}
+
 # Estado inicial de la aplicación
 selected_tool = None
 selected_color = BLACK
+guide_color = make_guide_color(selected_color)  # Se recalcula solo al cambiar de color
 selected_line_algorithm = 'pygame'
 selected_circle_algorithm = 'pygame'
 selected_polygon_sides = 5
@@ -75,34 +222,51 @@ current_algorithm_panel = None
 points = [] 
 point_radius = 5
 
+# Plantilla blanca y semitransparente de los marcadores de puntos
+point_marker_mask = pygame.Surface((point_radius*2+1, point_radius*2+1), pygame.SRCALPHA).convert_alpha()
+pygame.draw.circle(point_marker_mask, (255, 255, 255, 200), (point_radius, point_radius), point_radius)
+
 # Lista para almacenar figuras permanentes
 drawn_shapes = []
+# Cuántas figuras de drawn_shapes ya están pintadas en canvas_surface
+drawn_count = 0
 
 # Creación de superficies iniciales
-canvas_surface, preview_surface, CANVAS_HEIGHT = create_canvas_surfaces(show_algorithm_panel)
+(canvas_surface, preview_surface, guide_overlay,
+ canvas_view, canvas_rect) = create_canvas_surfaces(show_algorithm_panel)
 
 # Bucle principal
+clock = pygame.time.Clock()
+dirty = True  # Indica si toda la pantalla debe volver a presentarse
+last_mouse_pos = None  # Posición del ratón en el último frame dibujado
+preview_area = None  # Zona de preview_surface escrita en el último frame
+preview_shape = None  # Figura de la previsualización, reutilizada mientras no cambie
+preview_key = None
 running = True
 while running:
-    # Limpiar previsualización en cada frame
-    preview_surface.fill((0, 0, 0, 0))
+    # Sin un arrastre en curso la imagen solo cambia con los eventos, así que
+    # se espera al siguiente en lugar de redibujar continuamente. Si ya hay algo
+    # pendiente de presentar (el primer frame, por ejemplo) no se espera
+    if drawing or dirty:
+        events = pygame.event.get()
+    else:
+        events = [pygame.event.wait()] + pygame.event.get()
 
     # Obtener posición del ratón y calcular coordenadas relativas al canvas
     current_mouse_pos = None
     mouse_pos_screen = pygame.mouse.get_pos()
-    is_mouse_on_canvas = False
+    is_mouse_on_canvas = canvas_rect.collidepoint(mouse_pos_screen)
     
-    panel_height_offset = ALGORITHM_PANEL_HEIGHT if show_algorithm_panel else 0
-    
-    if LEFT_PANEL_WIDTH <= mouse_pos_screen[0] < SCREEN_WIDTH - RIGHT_PANEL_WIDTH and \
-       panel_height_offset <= mouse_pos_screen[1] < SCREEN_HEIGHT:
-        is_mouse_on_canvas = True
-        current_mouse_pos = (mouse_pos_screen[0] - LEFT_PANEL_WIDTH, mouse_pos_screen[1] - panel_height_offset)
+    if is_mouse_on_canvas:
+        current_mouse_pos = (mouse_pos_screen[0] - canvas_rect.x, mouse_pos_screen[1] - canvas_rect.y)
 
     # Gestión de eventos
-    for event in pygame.event.get():
+    for event in events:
         if event.type == pygame.QUIT:
             running = False
+        
+        # Todos los eventos permitidos pueden cambiar lo que se muestra
+        dirty = True
 
         # Procesar eventos del panel de herramientas
         tool_action = tool_panel.handle_event(event)
@@ -110,6 +274,8 @@ while running:
             if tool_action == 'clear':
                 drawn_shapes = []
                 points = []
+                canvas_surface.fill(WHITE)
+                drawn_count = 0
             else:
                 selected_tool = tool_action
                 points = []
@@ -117,28 +283,21 @@ while running:
                 start_pos = None
                 
                 # Actualizar panel de algoritmos según herramienta seleccionada
-                new_show_algorithm_panel = False
-                new_algorithm_panel = None
-                
-                if selected_tool == 'line':
-                    new_show_algorithm_panel = True
-                    new_algorithm_panel = 'line'
-                elif selected_tool == 'circle':
-                    new_show_algorithm_panel = True
-                    new_algorithm_panel = 'circle'
-                elif selected_tool == 'polygon':
-                    new_show_algorithm_panel = True
-                    new_algorithm_panel = 'polygon'
+                new_algorithm_panel = selected_tool if selected_tool in TOOL_PANELS else None
+                new_show_algorithm_panel = new_algorithm_panel is not None
                 
                 if new_show_algorithm_panel != show_algorithm_panel or current_algorithm_panel != new_algorithm_panel:
                     show_algorithm_panel = new_show_algorithm_panel
                     current_algorithm_panel = new_algorithm_panel
-                    canvas_surface, preview_surface, CANVAS_HEIGHT = create_canvas_surfaces(show_algorithm_panel)
+                    (canvas_surface, preview_surface, guide_overlay,
+                     canvas_view, canvas_rect) = create_canvas_surfaces(show_algorithm_panel)
+                    drawn_count = 0
 
         # Procesar eventos del panel de colores
         color_action = color_panel.handle_event(event)
         if color_action:
             selected_color = color_action
+            guide_color = make_guide_color(selected_color)
             
         # Procesar eventos de los paneles de algoritmos
         if show_algorithm_panel:
@@ -160,135 +319,144 @@ while running:
             canvas_pos = current_mouse_pos
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Botón izquierdo
-                    if selected_tool in ['line', 'rectangle', 'circle', 'ellipse']:
+                    if selected_tool in DRAG_TOOLS:
                         drawing = True
                         start_pos = canvas_pos
-                    elif selected_tool in ['triangle', 'polygon', 'curve']:
+                    elif selected_tool in MULTIPOINT_TOOLS:
                         points.append(canvas_pos)
                         # Finalizar figuras multipunto cuando se alcanza el número requerido de puntos
-                        if selected_tool == 'triangle' and len(points) == 3:
-                            new_shape = fig.Triangle(points, selected_color, filled=False)
-                            drawn_shapes.append(new_shape)
-                            points = []
-                        elif selected_tool == 'curve' and len(points) == 4:
-                            new_shape = fig.BezierCurve(points, selected_color, filled=False)
-                            drawn_shapes.append(new_shape)
-                            points = []
-                        elif selected_tool == 'polygon' and len(points) == selected_polygon_sides:
-                            new_shape = fig.Polygon(points, selected_color, filled=False)
+                        shape_class, required_points = MULTIPOINT_TOOLS[selected_tool]
+                        if len(points) == (required_points or selected_polygon_sides):
+                            new_shape = shape_class(points, selected_color, filled=False)
                             drawn_shapes.append(new_shape)
                             points = []
 
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1 and drawing and selected_tool and start_pos:
                     end_pos = canvas_pos
-                    new_shape = None
                     
                     # Crear figura según la herramienta seleccionada
-                    if selected_tool == 'line':
-                        new_shape = fig.Line(start_pos, end_pos, selected_color, filled=False, algorithm=selected_line_algorithm)
-                    elif selected_tool == 'rectangle':
-                        new_shape = fig.Rectangle.from_points(start_pos, end_pos, selected_color, filled=False)
-                    elif selected_tool == 'circle':
-                        new_shape = fig.Circle.from_points(start_pos, end_pos, selected_color, filled=False, algorithm=selected_circle_algorithm)
-                    elif selected_tool == 'ellipse':
-                         new_shape = fig.Ellipse.from_points(start_pos, end_pos, selected_color, filled=False)
-
-                    if new_shape:
-                        drawn_shapes.append(new_shape)
+                    new_shape = DRAG_TOOLS[selected_tool](start_pos, end_pos, selected_color)
+                    drawn_shapes.append(new_shape)
 
                     drawing = False
                     start_pos = None
 
+    # Sin eventos, solo hay que redibujar si el ratón se ha movido durante un
+    # arrastre; si no, se espera al siguiente frame sin componer nada
+    if not dirty and (not drawing or current_mouse_pos == last_mouse_pos):
+        clock.tick(FPS)
+        continue
+    last_mouse_pos = current_mouse_pos
+    previous_area = preview_area
+
+    # Limpiar solo la zona que ocupó la previsualización anterior
+    if previous_area:
+        preview_surface.fill(PREVIEW_KEY, previous_area)
+    preview_area = None
+
     # Generar previsualización durante el arrastre
     if drawing and selected_tool and start_pos and current_mouse_pos:
-        preview_color = selected_color
-        temp_shape = None
-
-        if selected_tool == 'line':
-            temp_shape = fig.Line(start_pos, current_mouse_pos, preview_color, filled=False, algorithm=selected_line_algorithm)
-        elif selected_tool == 'rectangle':
-            temp_shape = fig.Rectangle.from_points(start_pos, current_mouse_pos, preview_color, filled=False)
-        elif selected_tool == 'circle':
-            temp_shape = fig.Circle.from_points(start_pos, current_mouse_pos, preview_color, filled=False, algorithm=selected_circle_algorithm)
-        elif selected_tool == 'ellipse':
-             temp_shape = fig.Ellipse.from_points(start_pos, current_mouse_pos, preview_color, filled=False)
-
-        if temp_shape:
-            temp_shape.draw(preview_surface)
-    
-    # Visualización para figuras multipunto (triángulo, polígono, curva)
-    if selected_tool in ['triangle', 'curve', 'polygon'] and len(points) > 0:
-        # Dibujar puntos de referencia
-        for point in points:
-            temp_surface = pygame.Surface((point_radius*2+1, point_radius*2+1), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surface, (*selected_color, 200), (point_radius, point_radius), point_radius)
-            preview_surface.blit(temp_surface, (point[0]-point_radius, point[1]-point_radius))
-            
-            # Indicar orden de los puntos
-            font = pygame.font.SysFont(None, 20)
-            text = font.render(str(points.index(point)+1), True, WHITE)
-            text_rect = text.get_rect(center=point)
-            preview_surface.blit(text, text_rect)
-            
-        # Visualizar guías específicas según figura
-        if selected_tool == 'curve' and len(points) >= 2:
-            # Líneas guía para curvas Bézier
-            guide_color = (min(selected_color[0] + 100, 255), 
-                          min(selected_color[1] + 100, 255), 
-                          min(selected_color[2] + 100, 255), 150)
+        # La figura solo se crea de nuevo si ha cambiado algo de lo que la define;
+        # con el ratón quieto se reutiliza junto con sus píxeles ya calculados
+        key = (selected_tool, start_pos, current_mouse_pos, selected_color,
+               selected_line_algorithm, selected_circle_algorithm)
+        if key != preview_key:
+            preview_shape = DRAG_TOOLS[selected_tool](start_pos, current_mouse_pos, selected_color)
+            preview_key = key
+
+        preview_shape.draw(preview_surface)
+        preview_area = preview_shape.bounding_rect().inflate(2, 2).clip(preview_surface.get_rect())
+
+    # Renderizado de la interfaz
+    # 1. Actualizar canvas: es persistente, así que solo se pintan las figuras
+    # nuevas (todas tras limpiar o recrear la superficie)
+    if len(drawn_shapes) > drawn_count:
+        for shape in drawn_shapes[drawn_count:]:
+            shape.draw(canvas_surface)
+        drawn_count = len(drawn_shapes)
+
+    canvas_origin = canvas_rect.topleft
+    if dirty:
+        # 2. Componer capas en la pantalla principal
+        screen.blit(canvas_surface, canvas_origin)
+        # Fuera de preview_area la previsualización solo tiene el color clave
+        if preview_area:
+            screen.blit(preview_surface, preview_area.move(canvas_origin), preview_area)
+
+        # Visualización para figuras multipunto (triángulo, polígono, curva). Se
+        # dibuja en la capa con alfa, como hacía la antigua previsualización
+        # SRCALPHA, y se mezcla de una vez con la pantalla ya compuesta
+        if selected_tool in MULTIPOINT_TOOLS and len(points) > 0:
+            # Dibujar puntos de referencia, todos con una sola llamada
+            marker = get_point_marker(selected_color)
+            overlay_rects = guide_overlay.blits(
+                [(marker, (point[0]-point_radius, point[1]-point_radius)) for point in points])
+        
+            for i, point in enumerate(points):
+                # Indicar orden de los puntos
+                text = get_point_label(i + 1)
+                text_rect = text.get_rect(center=point)
+                overlay_rects.append(guide_overlay.blit(text, text_rect))
             
-            for i in range(len(points)-1):
-                pygame.draw.line(preview_surface, guide_color, points[i], points[i+1], 1)
+            # Visualizar guías específicas según figura
+            if selected_tool == 'curve' and len(points) >= 2:
+                # Líneas guía semitransparentes para curvas Bézier
+                overlay_rects.append(pygame.draw.lines(guide_overlay, guide_color, False, points, 1))
             
-        # Visualizar perímetro parcial para triángulos
-        elif selected_tool == 'triangle' and len(points) >= 2:
-            for i in range(len(points)-1):
-                pygame.draw.line(preview_surface, selected_color, points[i], points[i+1], 1)
+            # Visualizar perímetro parcial para triángulos
+            elif selected_tool == 'triangle' and len(points) >= 2:
+                for i in range(len(points)-1):
+                    overlay_rects.append(pygame.draw.line(guide_overlay, selected_color,
+                                                          points[i], points[i+1], 1))
             
-            if len(points) == 3:
-                pygame.draw.line(preview_surface, selected_color, points[2], points[0], 1)
+                if len(points) == 3:
+                    overlay_rects.append(pygame.draw.line(guide_overlay, selected_color,
+                                                          points[2], points[0], 1))
         
-        # Visualizar perímetro parcial para polígonos
-        elif selected_tool == 'polygon' and len(points) >= 2:
-            for i in range(len(points)-1):
-                pygame.draw.line(preview_surface, selected_color, points[i], points[i+1], 1)
+            # Visualizar perímetro parcial para polígonos
+            elif selected_tool == 'polygon' and len(points) >= 2:
+                for i in range(len(points)-1):
+                    overlay_rects.append(pygame.draw.line(guide_overlay, selected_color,
+                                                          points[i], points[i+1], 1))
             
-            if len(points) == selected_polygon_sides or (len(points) >= 3):
-                pygame.draw.line(preview_surface, selected_color, points[-1], points[0], 1)
+                if len(points) == selected_polygon_sides or (len(points) >= 3):
+                    overlay_rects.append(pygame.draw.line(guide_overlay, selected_color,
+                                                          points[-1], points[0], 1))
             
-            # Mostrar contador de puntos
-            count_text = f"Punto {len(points)} de {selected_polygon_sides}"
-            count_font = pygame.font.SysFont(None, 18)
-            count_surf = count_font.render(count_text, True, BLACK)
-            count_rect = count_surf.get_rect(topright=(CANVAS_WIDTH - 10, 10))
-            preview_surface.blit(count_surf, count_rect)
-
-    # Renderizado de la interfaz
-    # 1. Limpiar y actualizar canvas
-    canvas_surface.fill(WHITE)
-    for shape in drawn_shapes:
-        shape.draw(canvas_surface)
+                # Mostrar contador de puntos
+                count_surf = get_count_label(len(points), selected_polygon_sides)
+                count_rect = count_surf.get_rect(topright=(CANVAS_WIDTH - 10, 10))
+                overlay_rects.append(guide_overlay.blit(count_surf, count_rect))
 
-    # 2. Componer capas en la pantalla principal
-    panel_height_offset = ALGORITHM_PANEL_HEIGHT if show_algorithm_panel else 0
-    screen.blit(canvas_surface, (LEFT_PANEL_WIDTH, panel_height_offset))
-    screen.blit(preview_surface, (LEFT_PANEL_WIDTH, panel_height_offset))
+            # Mezclar la zona usada de la capa con el canvas y dejarla transparente
+            overlay_area = overlay_rects[0].unionall(overlay_rects[1:])
+            canvas_view.blit(guide_overlay, overlay_area, overlay_area)
+            guide_overlay.fill((0, 0, 0, 0), overlay_area)
 
-    # 3. Dibujar interfaz
-    tool_panel.draw(screen)
-    color_panel.draw(screen)
+        # 3. Dibujar interfaz
+        tool_panel.draw(screen)
+        color_panel.draw(screen)
     
-    if show_algorithm_panel:
-        if current_algorithm_panel == 'line':
-            algorithm_line_panel.draw(screen)
-        elif current_algorithm_panel == 'circle':
-            algorithm_circle_panel.draw(screen)
-        elif current_algorithm_panel == 'polygon':
-            polygon_sides_panel.draw(screen)
-
-    # Actualizar display
-    pygame.display.flip()
+        if show_algorithm_panel:
+            TOOL_PANELS[current_algorithm_panel].draw(screen)
+
+        pygame.display.flip()
+    else:
+        # Solo se ha movido la previsualización del arrastre: basta con recomponer
+        # y presentar la zona que ocupaba antes y la que ocupa ahora
+        changed = [area for area in (previous_area, preview_area) if area]
+        if changed:
+            area = changed[0].unionall(changed[1:])
+            dest = (canvas_rect.x + area.x, canvas_rect.y + area.y)
+            screen.blits(((canvas_surface, dest, area), (preview_surface, dest, area)),
+                         doreturn=False)
+            # Algunos botones del panel de algoritmos sobresalen sobre el canvas
+            if show_algorithm_panel:
+                TOOL_PANELS[current_algorithm_panel].draw(screen)
+            pygame.display.update(area.move(canvas_origin))
+    dirty = False
+    clock.tick(FPS)
 
 # Finalizar aplicación
 pygame.quit()
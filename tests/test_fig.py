@@ -0,0 +1,38 @@
+"""
+Pruebas de los algoritmos de rasterización de fig.py
+"""
+import os
+import sys
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fig
+
+
+def test_dda_acepta_extremos_decimales():
+    surface = pygame.Surface((40, 30))
+    line = fig.Line((1.5, 2.2), (30.7, 20.1), (255, 0, 0), algorithm='dda')
+    line.draw(surface)
+
+    points = line._dda_points()
+    assert points[0] == (1, 2)
+    assert points[-1] == (30, 20)
+    assert surface.get_at((1, 2))[:3] == (255, 0, 0)
+
+
+def test_dda_redondea_al_pixel_mas_cercano():
+    # En el paso 177 la x exacta es 310.501
+    line = fig.Line((193, 556), (507, 83), (0, 0, 0), algorithm='dda')
+    assert line._dda_points()[177][0] == 311
+
+
+def test_las_figuras_no_se_pueden_modificar():
+    line = fig.Line((0, 0), (10, 5), (0, 0, 0), algorithm='dda')
+    line.draw(pygame.Surface((20, 20)))
+    with pytest.raises(AttributeError):
+        line.color = (255, 0, 0)
+    with pytest.raises(AttributeError):
+        line.end_pos = (15, 15)
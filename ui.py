@@ -6,6 +6,7 @@ y funciones para dibujar iconos. Gestiona la interacción del usuario con
 las herramientas y configuraciones del graficador.
 """
 import pygame
+import functools
 
 # Definición de colores
 WHITE = (255, 255, 255)
@@ -18,6 +19,48 @@ BLUE = (0, 0, 255)
 YELLOW = (255, 255, 0)
 ORANGE = (255, 165, 0)
 
+# Acciones de botones que se ejecutan al pulsarlos pero nunca quedan seleccionados
+_NON_SELECTABLE = frozenset({'clear'})
+
+# Fuentes y textos ya renderizados, compartidos por todos los botones y paneles
+_fonts = {}
+_text_surfaces = {}
+
+def _get_font(size):
+    """
+    Devuelve la fuente por defecto del tamaño indicado, creándola solo la primera vez.
+    
+    Args:
+        size: Tamaño de la fuente en puntos
+        
+    Returns:
+        Objeto pygame.font.Font
+    """
+    font = _fonts.get(size)
+    if font is None:
+        font = pygame.font.SysFont(None, size)
+        _fonts[size] = font
+    return font
+
+def _render_text(text, size, color):
+    """
+    Devuelve el texto renderizado con antialiasing, renderizándolo solo la primera vez.
+    
+    Args:
+        text: Cadena a renderizar
+        size: Tamaño de la fuente en puntos
+        color: Color RGB del texto
+        
+    Returns:
+        Superficie pygame con el texto
+    """
+    key = (text, size, color)
+    surf = _text_surfaces.get(key)
+    if surf is None:
+        surf = _get_font(size).render(text, True, color)
+        _text_surfaces[key] = surf
+    return surf
+
 class Button:
     """
     Implementa un botón interactivo con soporte para iconos o texto.
@@ -35,15 +78,28 @@ class Button:
         self.color = color
         self.icon_func = icon_func
         self.action = action
-        self.is_selected = False
+        self.is_selected = False  # También fija _border_color
         self.text = text
         if self.text:
-             pygame.font.init()
              font_size = 18 if action == 'clear' else 24
-             self.font = pygame.font.SysFont(None, font_size)
-             self.text_surf = self.font.render(text, True, BLACK)
+             self.font = _get_font(font_size)
+             self.text_surf = _render_text(text, font_size, BLACK)
              self.text_rect = self.text_surf.get_rect(center=self.rect.center)
 
+    @property
+    def is_selected(self):
+        """Indica si el botón está seleccionado."""
+        return self._is_selected
+
+    @is_selected.setter
+    def is_selected(self, value):
+        # El color del borde solo depende de la selección: se calcula al cambiarla
+        self._is_selected = value
+        if value and self.action not in _NON_SELECTABLE:
+            self._border_color = BLACK
+        else:
+            self._border_color = GRAY
+
     def draw(self, surface):
         """
         Dibuja el botón en la superficie especificada.
@@ -52,9 +108,7 @@ class Button:
             surface: Superficie pygame donde se dibujará el botón
         """
         pygame.draw.rect(surface, self.color, self.rect)
-        
-        border_color = BLACK if self.is_selected and self.action not in ['clear'] else GRAY
-        pygame.draw.rect(surface, border_color, self.rect, 2)
+        pygame.draw.rect(surface, self._border_color, self.rect, 2)
 
         if self.icon_func:
             self.icon_func(surface, self.rect)
@@ -73,7 +127,7 @@ class Button:
         """
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
-                if self.action not in ['clear']:
+                if self.action not in _NON_SELECTABLE:
                     self.is_selected = True
                 return self.action
         return None
@@ -81,33 +135,52 @@ class Button:
 # Funciones para dibujar iconos
 def draw_line_icon(surface, rect):
     """Dibuja un icono de línea."""
-    pygame.draw.line(surface, BLACK, rect.topleft + pygame.Vector2(5, 5),
-                     rect.bottomright - pygame.Vector2(5, 5), 2)
+    pygame.draw.line(surface, BLACK, (rect.left + 5, rect.top + 5),
+                     (rect.right - 5, rect.bottom - 5), 2)
 
 def draw_curve_icon(surface, rect):
     """Dibuja un icono de curva Bézier."""
-    p0 = rect.topleft + pygame.Vector2(5, rect.height * 0.7)
-    p1 = rect.topleft + pygame.Vector2(rect.width * 0.3, 5)
-    p2 = rect.topright + pygame.Vector2(-rect.width * 0.3, rect.height - 5)
-    p3 = rect.bottomright + pygame.Vector2(-5, -rect.height * 0.7)
+    points = _curve_icon_points(rect.x, rect.y, rect.width, rect.height)
+    pygame.draw.lines(surface, BLACK, False, points, 2)
+
+@functools.lru_cache(maxsize=None)
+def _curve_icon_points(x, y, width, height):
+    """
+    Calcula los puntos del icono de curva Bézier para un botón.
+    
+    Los botones no cambian de tamaño ni de posición, así que la curva se
+    evalúa una sola vez por rectángulo y se reutiliza en cada redibujado.
+    
+    Args:
+        x, y: Esquina superior izquierda del botón
+        width, height: Dimensiones del botón
+        
+    Returns:
+        Tupla de puntos enteros (x, y) de la curva
+    """
+    right = x + width
+    bottom = y + height
+    p0 = (x + 5, y + height * 0.7)
+    p1 = (x + width * 0.3, y + 5)
+    p2 = (right - width * 0.3, y + height - 5)
+    p3 = (right - 5, bottom - height * 0.7)
     
     points = []
     steps = 12
     for i in range(steps + 1):
         t = i / steps
         inv_t = 1 - t
-        x = (inv_t**3 * p0[0] + 
-             3 * inv_t**2 * t * p1[0] + 
-             3 * inv_t * t**2 * p2[0] + 
-             t**3 * p3[0])
-        y = (inv_t**3 * p0[1] + 
-             3 * inv_t**2 * t * p1[1] + 
-             3 * inv_t * t**2 * p2[1] + 
-             t**3 * p3[1])
-        points.append((int(x), int(y)))
+        px = (inv_t**3 * p0[0] + 
+              3 * inv_t**2 * t * p1[0] + 
+              3 * inv_t * t**2 * p2[0] + 
+              t**3 * p3[0])
+        py = (inv_t**3 * p0[1] + 
+              3 * inv_t**2 * t * p1[1] + 
+              3 * inv_t * t**2 * p2[1] + 
+              t**3 * p3[1])
+        points.append((int(px), int(py)))
     
-    if len(points) > 1:
-        pygame.draw.lines(surface, BLACK, False, points, 2)
+    return tuple(points)
 
 def draw_rect_icon(surface, rect):
     """Dibuja un icono de rectángulo."""
@@ -125,20 +198,52 @@ def draw_ellipse_icon(surface, rect):
 
 def draw_triangle_icon(surface, rect):
     """Dibuja un icono de triángulo."""
-    points = [rect.midtop + pygame.Vector2(0, 5),
-              rect.bottomleft + pygame.Vector2(5, -5),
-              rect.bottomright + pygame.Vector2(-5, -5)]
+    points = _triangle_icon_points(rect.x, rect.y, rect.width, rect.height)
     pygame.draw.polygon(surface, BLACK, points, 2)
 
 def draw_polygon_icon(surface, rect):
     """Dibuja un icono de polígono (pentágono)."""
-    points = [rect.midtop + pygame.Vector2(0, 5),
-              rect.topright + pygame.Vector2(-5, 15),
-              rect.bottomright + pygame.Vector2(-15, -5),
-              rect.bottomleft + pygame.Vector2(15, -5),
-              rect.topleft + pygame.Vector2(5, 15)]
+    points = _polygon_icon_points(rect.x, rect.y, rect.width, rect.height)
     pygame.draw.polygon(surface, BLACK, points, 2)
 
+@functools.lru_cache(maxsize=None)
+def _triangle_icon_points(x, y, width, height):
+    """
+    Calcula los vértices del icono de triángulo para un botón.
+    
+    Args:
+        x, y: Esquina superior izquierda del botón
+        width, height: Dimensiones del botón
+        
+    Returns:
+        Tupla de vértices (x, y) del triángulo
+    """
+    right = x + width
+    bottom = y + height
+    return ((x + width // 2, y + 5),
+            (x + 5, bottom - 5),
+            (right - 5, bottom - 5))
+
+@functools.lru_cache(maxsize=None)
+def _polygon_icon_points(x, y, width, height):
+    """
+    Calcula los vértices del icono de pentágono para un botón.
+    
+    Args:
+        x, y: Esquina superior izquierda del botón
+        width, height: Dimensiones del botón
+        
+    Returns:
+        Tupla de vértices (x, y) del pentágono
+    """
+    right = x + width
+    bottom = y + height
+    return ((x + width // 2, y + 5),
+            (right - 5, y + 15),
+            (right - 15, bottom - 5),
+            (x + 15, bottom - 5),
+            (x + 5, y + 15))
+
 class Panel:
     """
     Clase base para todos los paneles de la interfaz.
@@ -147,15 +252,42 @@ class Panel:
         rect: Rectángulo que define la posición y tamaño del panel
         color: Color de fondo del panel
         buttons: Lista de botones contenidos en el panel
+        selected_button: Botón seleccionado del panel, o None
     """
     def __init__(self, x, y, width, height, color):
         self.rect = pygame.Rect(x, y, width, height)
         self.color = color
         self.buttons = []
+        self.selected_button = None
+        # Imágenes del panel ya dibujado con la zona que ocupa cada una; None
+        # cuando hay que volver a dibujarlo
+        self._cached_surfs = None
+        # Zona que cubren el panel y sus botones, que pueden sobresalir de él;
+        # se calcula en el primer clic, cuando los botones ya están creados
+        self._hit_rect = None
 
     def draw(self, surface):
         """
-        Dibuja el panel y sus botones en la superficie especificada.
+        Dibuja el panel en la superficie especificada.
+        
+        El panel solo cambia cuando se pulsa uno de sus botones, así que tras
+        dibujarlo se guarda una copia de su zona, y de la de cada botón que
+        sobresale de ella, y en los frames siguientes basta con volcarlas.
+        
+        Args:
+            surface: Superficie pygame donde se dibujará el panel
+        """
+        if self._cached_surfs is None:
+            self._draw_contents(surface)
+            areas = [self.rect] + [button.rect for button in self.buttons
+                                   if not self.rect.contains(button.rect)]
+            self._cached_surfs = [(surface.subsurface(area).copy(), area) for area in areas]
+        else:
+            surface.blits(self._cached_surfs, doreturn=False)
+
+    def _draw_contents(self, surface):
+        """
+        Dibuja el fondo del panel y sus botones.
         
         Args:
             surface: Superficie pygame donde se dibujará el panel
@@ -164,6 +296,22 @@ class Panel:
         for button in self.buttons:
             button.draw(surface)
 
+    def _select(self, button):
+        """
+        Marca un botón como el único seleccionado del panel.
+        
+        Solo se toca el botón seleccionado hasta ahora y el nuevo, en lugar de
+        recorrer todos los botones del panel.
+        
+        Args:
+            button: Botón del panel que pasa a estar seleccionado
+        """
+        previous = self.selected_button
+        if previous is not None and previous is not button:
+            previous.is_selected = False
+        button.is_selected = True
+        self.selected_button = button
+
     def handle_event(self, event):
         """
         Procesa eventos de usuario relacionados con los botones del panel.
@@ -174,13 +322,21 @@ class Panel:
         Returns:
             El identificador de acción del botón clickeado, None si ninguno fue clickeado
         """
+        # Los botones solo responden a clics, y solo a los que caen sobre alguno
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return None
+        if self._hit_rect is None:
+            self._hit_rect = self.rect.unionall([button.rect for button in self.buttons])
+        if not self._hit_rect.collidepoint(event.pos):
+            return None
         for button in self.buttons:
             action = button.handle_event(event)
             if action:
-                if hasattr(button, 'is_selected') and button.action not in ['clear']:
-                    for b in self.buttons:
-                        if hasattr(b, 'is_selected'): b.is_selected = False
-                    button.is_selected = True
+                if (button is not self.selected_button
+                        and button.action not in _NON_SELECTABLE):
+                    # La selección de los botones cambia: redibujar el panel
+                    self._cached_surfs = None
+                    self._select(button)
                 return action
         return None
 
@@ -232,8 +388,8 @@ class ColorPanel(Panel):
     """
     Panel de selección de colores.
     
-    Attributes:
-        color_map: Diccionario que mapea identificadores de colores a valores RGB
+    Cada botón de color tiene como fondo el propio color que representa, así
+    que el valor RGB seleccionado se toma directamente del botón pulsado.
     """
     def __init__(self, x, y, width, height, color):
         super().__init__(x, y, width, height, color)
@@ -256,8 +412,6 @@ class ColorPanel(Panel):
             (BLACK, 'color_black')
         ]
 
-        self.color_map = {name: rgb for rgb, name in colors}
-
         for i, (color_val, action_name) in enumerate(colors):
             button = Button(self.rect.x + padding,
                             self.rect.y + y_offset + i * (button_size + 5),
@@ -276,11 +430,8 @@ class ColorPanel(Panel):
         Returns:
             Valor RGB del color seleccionado o None
         """
-        action = super().handle_event(event)
-        if action and action in self.color_map:
-             for btn in self.buttons:
-                 btn.is_selected = (btn.action == action)
-             return self.color_map[action]
+        if super().handle_event(event):
+            return self.selected_button.color
         return None
 
 class AlgorithmPanel(Panel):
@@ -303,9 +454,8 @@ class AlgorithmPanel(Panel):
         y_offset = 10
 
         # Título del panel
-        pygame.font.init()
-        self.font = pygame.font.SysFont(None, 24)
-        self.title_surf = self.font.render("Algoritmos de Línea", True, BLACK)
+        self.font = _get_font(24)
+        self.title_surf = _render_text("Algoritmos de Línea", 24, BLACK)
         self.title_rect = self.title_surf.get_rect(
             center=(self.rect.x + self.rect.width // 2, self.rect.y + y_offset)
         )
@@ -325,18 +475,18 @@ class AlgorithmPanel(Panel):
                             color=LIGHT_GRAY,
                             action=algo_id,
                             text=algo_name)
-            if algo_id == 'pygame':
-                button.is_selected = True
             self.buttons.append(button)
+            if algo_id == 'pygame':
+                self._select(button)
             
-    def draw(self, surface):
+    def _draw_contents(self, surface):
         """
         Dibuja el panel, sus botones y el título.
         
         Args:
             surface: Superficie pygame donde se dibujará el panel
         """
-        super().draw(surface)
+        super()._draw_contents(surface)
         surface.blit(self.title_surf, self.title_rect)
 
     def handle_event(self, event):
@@ -352,8 +502,6 @@ class AlgorithmPanel(Panel):
         action = super().handle_event(event)
         if action in ['pygame', 'dda', 'bresenham']:
             self.selected_algorithm = action
-            for btn in self.buttons:
-                btn.is_selected = (btn.action == action)
             return action
         return None
 
@@ -377,9 +525,8 @@ class AlgorithmCirclePanel(Panel):
         y_offset = 10
 
         # Título del panel
-        pygame.font.init()
-        self.font = pygame.font.SysFont(None, 24)
-        self.title_surf = self.font.render("Algoritmos de Círculo", True, BLACK)
+        self.font = _get_font(24)
+        self.title_surf = _render_text("Algoritmos de Círculo", 24, BLACK)
         self.title_rect = self.title_surf.get_rect(
             center=(self.rect.x + self.rect.width // 2, self.rect.y + y_offset)
         )
@@ -398,18 +545,18 @@ class AlgorithmCirclePanel(Panel):
                             color=LIGHT_GRAY,
                             action=algo_id,
                             text=algo_name)
-            if algo_id == 'pygame':
-                button.is_selected = True
             self.buttons.append(button)
+            if algo_id == 'pygame':
+                self._select(button)
 
-    def draw(self, surface):
+    def _draw_contents(self, surface):
         """
         Dibuja el panel, sus botones y el título.
         
         Args:
             surface: Superficie pygame donde se dibujará el panel
         """
-        super().draw(surface)
+        super()._draw_contents(surface)
         surface.blit(self.title_surf, self.title_rect)
 
     def handle_event(self, event):
@@ -425,8 +572,6 @@ class AlgorithmCirclePanel(Panel):
         action = super().handle_event(event)
         if action in ['pygame', 'bresenham']:
             self.selected_algorithm = action
-            for btn in self.buttons:
-                btn.is_selected = (btn.action == action)
             return action
         return None
 
@@ -450,9 +595,8 @@ class PolygonSidesPanel(Panel):
         y_offset = 10
         
         # Título del panel
-        pygame.font.init()
-        self.font = pygame.font.SysFont(None, 24)
-        self.title_surf = self.font.render("Lados del Polígono", True, BLACK)
+        self.font = _get_font(24)
+        self.title_surf = _render_text("Lados del Polígono", 24, BLACK)
         self.title_rect = self.title_surf.get_rect(
             center=(self.rect.x + self.rect.width // 2, self.rect.y + y_offset)
         )
@@ -475,18 +619,18 @@ class PolygonSidesPanel(Panel):
                             color=LIGHT_GRAY,
                             action=str(sides),
                             text=text)
-            if sides == 5:
-                button.is_selected = True
             self.buttons.append(button)
+            if sides == 5:
+                self._select(button)
     
-    def draw(self, surface):
+    def _draw_contents(self, surface):
         """
         Dibuja el panel, sus botones y el título.
         
         Args:
             surface: Superficie pygame donde se dibujará el panel
         """
-        super().draw(surface)
+        super()._draw_contents(surface)
         surface.blit(self.title_surf, self.title_rect)
         
     def handle_event(self, event):
@@ -503,7 +647,5 @@ class PolygonSidesPanel(Panel):
         if action and action.isdigit():
             sides = int(action)
             self.selected_sides = sides
-            for btn in self.buttons:
-                btn.is_selected = (btn.action == action)
             return sides
         return None